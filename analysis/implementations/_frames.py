@@ -0,0 +1,15 @@
+import pandas as pd
+
+'''
+This module gives every analysis a single way to accept either a pandas DataFrame or an IngestedFrame,
+which carries its column groups precomputed at load time (see src/ingest_data.py and run_all_analyses.py).
+'''
+
+try:
+    from src.ingest_data import unwrap_frame
+except ImportError:  # Outside the repository root (e.g. in the notebook), src isn't importable and only DataFrames are passed in.
+    def unwrap_frame(data):
+        """Returns the given DataFrame along with its numerical columns (None, since they haven't been grouped)."""
+        if isinstance(data, pd.DataFrame):
+            return data, None
+        raise TypeError(f"Expected a pandas DataFrame, but got {type(data).__name__}.")
@@ -0,0 +1,104 @@
+import functools
+import hashlib
+import os
+import types
+import matplotlib
+import matplotlib.pyplot as plt
+import pandas as pd
+import seaborn as sns
+
+try:
+    from ._frames import unwrap_frame
+except ImportError:  # Running a module of this package directly as a script.
+    from _frames import unwrap_frame
+
+'''
+This module provides a disk-backed cache for expensive plots (e.g. heatmaps and pair plots).
+When a plot is requested again for the same data and settings, the previously rendered image is shown
+instead of recomputing and redrawing the plot, which speeds up repeated runs during development.
+Editing a plotting method (or upgrading matplotlib/seaborn) changes the cache key, so its stale images aren't reused.
+Setting the NO_PLOT_CACHE environment variable (or passing use_cache=False to a plotting method) bypasses the cache.
+'''
+
+CACHE_DIR = ".plot_cache"
+
+
+def _code_digest(code: types.CodeType) -> bytes:
+    """Hashes a function's compiled code, including its constants and any nested functions (whose reprs hold memory addresses)."""
+    digest = hashlib.blake2b(code.co_code, digest_size=16)
+    digest.update(repr(code.co_names).encode())
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            digest.update(_code_digest(const))
+        elif isinstance(const, frozenset):  # e.g. `x in {...}`; a set's order varies between runs (string hashes are randomized).
+            digest.update(repr(sorted(map(repr, const))).encode())
+        else:
+            digest.update(repr(const).encode())
+    return digest.digest()
+
+
+def _cache_key(plot_name: str, method, analysis, df: pd.DataFrame, args, kwargs) -> str:
+    """
+    Builds a key from the plot name, the plotting method's code, the plotting libraries' versions,
+    the analysis object's settings, the call's arguments, and the dataframe's contents.
+    """
+    settings = sorted((name, repr(value)) for name, value in vars(analysis).items() if not name.startswith("_"))
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(repr((plot_name, method.__qualname__, matplotlib.__version__, sns.__version__)).encode())
+    digest.update(_code_digest(method.__code__))
+    digest.update(repr((settings, args, sorted(kwargs.items()))).encode())
+    digest.update(repr((df.shape, list(df.columns), [str(dtype) for dtype in df.dtypes])).encode())
+    digest.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+def _show_cached_image(image_path: str):
+    """Displays a previously rendered plot at its original size."""
+    image = plt.imread(image_path)
+    height, width = image.shape[:2]
+    dpi = plt.rcParams["figure.dpi"]
+    fig = plt.figure(figsize=(width / dpi, height / dpi), dpi=dpi)
+    ax = fig.add_axes([0, 0, 1, 1])
+    ax.imshow(image)
+    ax.axis("off")
+    plt.show()
+
+
+def cached_plot(plot_name: str):
+    """
+    Decorator for plotting methods with the signature method(self, df, ...) that end by calling plt.show().
+
+    The first time a plot is generated for some data, the figure is saved as a PNG under CACHE_DIR right before it's shown.
+    Later calls with the same data and settings display the saved PNG instead of regenerating the plot.
+    With use_cache=False (or the NO_PLOT_CACHE environment variable set), the plot is always regenerated and isn't saved.
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, df, *args, use_cache=True, **kwargs):
+            if not use_cache or os.environ.get("NO_PLOT_CACHE"):
+                return method(self, df, *args, **kwargs)
+
+            data, _ = unwrap_frame(df)
+            key = _cache_key(plot_name, method, self, data, args, kwargs)
+            image_path = os.path.join(CACHE_DIR, f"{plot_name}-{key}.png")
+            if os.path.exists(image_path):
+                _show_cached_image(image_path)
+                return None
+
+            # Save the figure to the cache whenever the plotting method shows it.
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            show = plt.show
+
+            def save_and_show(*show_args, **show_kwargs):
+                plt.gcf().savefig(image_path, bbox_inches="tight")
+                show(*show_args, **show_kwargs)
+
+            plt.show = save_and_show
+            try:
+                return method(self, df, *args, **kwargs)
+            finally:
+                plt.show = show
+
+        return wrapper
+
+    return decorator
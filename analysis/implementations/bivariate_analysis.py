@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
 import seaborn as sns
 
@@ -27,6 +28,18 @@ class BivariateAnalysisStrategy(ABC):
 # -----------------------------------------------------------------
 # This strategy analyzes the relationship between two numerical features using a scatter plot.
 class NumericalVsNumericalAnalysis(BivariateAnalysisStrategy):
+    def __init__(self, max_points=50_000):
+        """
+        Initializes the NumericalVsNumericalAnalysis strategy.
+
+        Parameters:
+        max_points (int): The maximum number of points to plot. Larger dataframes are randomly sampled down to this size.
+
+        Returns:
+        None
+        """
+        self.max_points = max_points
+
     def analyze(self, df: pd.DataFrame, feature1: str, feature2: str):
         """
         Plots the relationship between two numerical features using a scatter plot.
@@ -39,8 +52,16 @@ class NumericalVsNumericalAnalysis(BivariateAnalysisStrategy):
         Returns:
         None: Displays a scatter plot showing the relationship between the two features.
         """
+        # Beyond a certain size, extra points only add drawing time, so we plot a reproducible random sample instead.
+        if len(df) > self.max_points:
+            df = df.sample(self.max_points, random_state=0)
+
+        # A single plt.scatter call on plain arrays draws every point as one rasterized collection.
+        x = df[feature1].to_numpy(dtype=float, na_value=np.nan)
+        y = df[feature2].to_numpy(dtype=float, na_value=np.nan)
+
         plt.figure(figsize=(10, 6))
-        sns.scatterplot(x=feature1, y=feature2, data=df)
+        plt.scatter(x, y, s=6, alpha=0.4, rasterized=True)
         plt.title(f"{feature1} vs {feature2}")
         plt.xlabel(feature1)
         plt.ylabel(feature2)
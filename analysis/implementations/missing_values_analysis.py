@@ -1,8 +1,14 @@
 from abc import ABC, abstractmethod
 import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
 import seaborn as sns
 
+try:
+    from ._plot_cache import cached_plot
+except ImportError:  # Running this file directly as a script.
+    from _plot_cache import cached_plot
+
 '''
 This module uses the Template Method Design Pattern to define a template for missing values analysis.
 The idea is to create a template that outlines the steps for analyzing missing values in a dataframe.
@@ -65,9 +71,11 @@ class SimpleMissingValuesAnalysis(MissingValuesAnalysisTemplate):
         None: Prints the count of missing values for each column to the console.
         """
         print("\nCounts of Missing Values by Column:")
-        missing_values = df.isnull().sum()
-        print(missing_values[missing_values > 0])
+        # Derive the missing counts from the non-null counts, avoiding a full boolean mask of the dataframe.
+        missing_values = len(df) - df.count()
+        print(missing_values[missing_values > 0].sort_values(ascending=False))
 
+    @cached_plot("missing_values_heatmap")
     def visualize_missing_values(self, df: pd.DataFrame):
         """
         Creates a heatmap to visualize the missing values in the dataframe.
@@ -79,8 +87,21 @@ class SimpleMissingValuesAnalysis(MissingValuesAnalysisTemplate):
         None: Displays a heatmap of missing values.
         """
         print("\nVisualizing Missing Values...")
-        plt.figure(figsize=(12, 8))
-        sns.heatmap(df.isnull(), cbar=False, cmap="viridis")
+        fig = plt.figure(figsize=(12, 8))
+
+        # The figure can only show about one row per pixel, so for long dataframes we bin consecutive rows together.
+        # A bin is marked missing if any of its rows are missing, which gives the same picture with far fewer cells to draw.
+        target_rows = int(fig.get_size_inches()[1] * fig.dpi)
+        if len(df) > target_rows:
+            bin_starts = np.linspace(0, len(df), target_rows, endpoint=False).astype(int)
+            missing_mask = pd.DataFrame(
+                {col: np.logical_or.reduceat(df[col].isnull().to_numpy(), bin_starts) for col in df.columns},
+                index=df.index[bin_starts],
+            )
+        else:
+            missing_mask = df.isnull()
+
+        sns.heatmap(missing_mask, cbar=False, cmap="viridis")
         plt.title("Missing Values Heatmap")
         plt.show()
 
@@ -1,8 +1,16 @@
 from abc import ABC, abstractmethod
 import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
 import seaborn as sns
 
+try:
+    from ._frames import unwrap_frame
+    from ._plot_cache import cached_plot
+except ImportError:  # Running this file directly as a script.
+    from _frames import unwrap_frame
+    from _plot_cache import cached_plot
+
 
 # This abstract base class defines the template for multivariate analysis processes.
 # Subclasses must implement the methods for generating a correlation heatmap and a pair plot.
@@ -52,6 +60,73 @@ class MultivariateAnalysisTemplate(ABC):
 # -------------------------------------------------------------------------------
 # This class implements the methods for generating a correlation heatmap and a pair plot.
 class SimpleMultivariateAnalysis(MultivariateAnalysisTemplate):
+    def __init__(self, max_features=6):
+        """
+        Initializes the SimpleMultivariateAnalysis.
+
+        Parameters:
+        max_features (int): The maximum number of features shown in the pair plot (it grows quadratically with the feature count).
+
+        Returns:
+        None
+        """
+        self.max_features = max_features
+        self._numerical_cols = None
+        self._mat = None
+
+    def analyze(self, df: pd.DataFrame):
+        """
+        Perform multivariate analysis, extracting the numerical data once and sharing it between the heatmap and pair plot.
+
+        Parameters:
+        df (pd.DataFrame): The dataframe containing the data to be analyzed (or an IngestedFrame wrapping it).
+
+        Returns:
+        None: This method carries out the multivariate analysis process.
+        """
+        # An IngestedFrame already knows its numerical columns, so we don't need to re-scan the dtypes.
+        df, numerical_cols = unwrap_frame(df)
+        if numerical_cols is not None:
+            self._numerical_cols = pd.Index(numerical_cols)
+        try:
+            self._numerical_cols, self._mat = self._numerical_matrix(df)
+            super().analyze(df)
+        finally:
+            self._numerical_cols, self._mat = None, None
+
+    def _numerical_matrix(self, df: pd.DataFrame):
+        """
+        Returns the numerical column names and their values as a single C-contiguous float32 matrix (NaN for missing values).
+        Within analyze(), the matrix extracted up front is reused instead of being rebuilt from the dataframe.
+        """
+        if self._mat is not None:
+            return self._numerical_cols, self._mat
+
+        if self._numerical_cols is not None:
+            numerical_df = df[self._numerical_cols]
+        else:
+            numerical_df = df.select_dtypes(include="number")
+        mat = np.ascontiguousarray(numerical_df.to_numpy(dtype=np.float32, na_value=np.nan))
+        return numerical_df.columns, mat
+
+    def _correlation_matrix(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Returns the Pearson correlation matrix of the numerical features in the dataframe."""
+        numerical_cols, mat = self._numerical_matrix(df)
+        if np.isnan(mat).any():
+            # The matrix product below can't skip missing values pairwise, so we let pandas handle that case.
+            return df[numerical_cols].corr(method="pearson")
+
+        # Standardize each column in float64 (a float32 mean of a long, high-offset column drifts by far more than
+        # its spread), then corr = Z^T Z / n is a single float32 matrix product, which NumPy hands to BLAS (SGEMM).
+        z = mat - mat.mean(axis=0, dtype=np.float64)
+        std = z.std(axis=0)
+        std[std == 0] = np.nan  # Constant columns have no defined correlation, matching pandas.
+        z /= std
+        z = z.astype(np.float32)
+        corr = np.clip((z.T @ z) / z.shape[0], -1.0, 1.0)
+        return pd.DataFrame(corr, index=numerical_cols, columns=numerical_cols)
+
+    @cached_plot("correlation_heatmap")
     def generate_correlation_heatmap(self, df: pd.DataFrame):
         """
         Generates and displays a correlation heatmap for the numerical features in the dataframe.
@@ -63,10 +138,11 @@ class SimpleMultivariateAnalysis(MultivariateAnalysisTemplate):
         None: Displays a heatmap showing correlations between numerical features.
         """
         plt.figure(figsize=(12, 10))
-        sns.heatmap(df.corr(), annot=True, fmt=".2f", cmap="coolwarm", linewidths=0.5)
+        sns.heatmap(self._correlation_matrix(df), annot=True, fmt=".2f", cmap="coolwarm", linewidths=0.5)
         plt.title("Correlation Heatmap")
         plt.show()
 
+    @cached_plot("pairplot")
     def generate_pairplot(self, df: pd.DataFrame):
         """
         Generates and displays a pair plot for the selected features in the dataframe.
@@ -77,7 +153,17 @@ class SimpleMultivariateAnalysis(MultivariateAnalysisTemplate):
         Returns:
         None: Displays a pair plot for the selected features.
         """
-        sns.pairplot(df)
+        # The pair plot only draws numerical features, so we plot straight from the numerical matrix.
+        numerical_cols, mat = self._numerical_matrix(df)
+        plot_df = pd.DataFrame(mat, columns=numerical_cols, copy=False)
+
+        # For wide dataframes, keep only the numerical features most correlated with the first one (e.g. our target).
+        if plot_df.shape[1] > self.max_features:
+            correlations = self._correlation_matrix(df)[numerical_cols[0]].abs()
+            plot_df = plot_df[correlations.nlargest(self.max_features).index]
+
+        # Histograms on the diagonal are much cheaper than KDEs, and rasterized scatters are drawn as single images.
+        sns.pairplot(plot_df, diag_kind="hist", plot_kws={"s": 8, "alpha": 0.4, "rasterized": True})
         plt.suptitle("Pair Plot of Selected Features", y=1.02)
         plt.show()
 
@@ -0,0 +1,156 @@
+import contextlib
+import functools
+import io
+import os
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+import matplotlib
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather
+
+from analysis.implementations.basic_data_inspection import (
+    DataInspector,
+    DataTypesInspectionStrategy,
+    SummaryStatisticsInspectionStrategy,
+    NumericalStatsInspectionStrategy,
+)
+from analysis.implementations.missing_values_analysis import SimpleMissingValuesAnalysis
+from analysis.implementations.univariate_analysis import (
+    UnivariateAnalyzer,
+    NumericalUnivariateAnalysis,
+    CategoricalUnivariateAnalysis,
+)
+from analysis.implementations.bivariate_analysis import (
+    BivariateAnalyzer,
+    NumericalVsNumericalAnalysis,
+    CategoricalVsNumericalAnalysis,
+)
+from analysis.implementations.multivariate_analysis import SimpleMultivariateAnalysis
+from src.ingest_data import IngestedFrame, ZipDataIngestor
+
+'''
+This script runs all of our EDA inspections and analyses in parallel.
+The analyses don't share any state, so each one runs as a separate task in a process pool.
+The parent process ingests the data once and writes it to an uncompressed Arrow IPC file, which each worker memory-maps
+instead of re-reading the CSV or receiving a pickled copy of the dataframe. Since the file isn't compressed, the workers'
+Arrow-backed columns point straight into the mapped pages, so all of them share one copy of the data in the OS page cache.
+Since workers can't open plot windows, every figure they show is saved as a PNG under the output directory.
+'''
+
+
+# Task functions (defined at the top level so they can be sent to the worker processes)
+# -----------------------------------------------------
+# Each task gets the worker's IngestedFrame, whose column groups were computed once when the data was loaded.
+def _inspect(frame: IngestedFrame, strategy):
+    DataInspector(strategy).execute_inspection(frame)
+
+
+def _analyze_missing_values(frame: IngestedFrame):
+    SimpleMissingValuesAnalysis().analyze(frame.df)
+
+
+def _analyze_univariate(frame: IngestedFrame, strategy, feature: str):
+    UnivariateAnalyzer(strategy).execute_analysis(frame.df, feature)
+
+
+def _analyze_bivariate(frame: IngestedFrame, strategy, feature1: str, feature2: str):
+    BivariateAnalyzer(strategy).execute_analysis(frame.df, feature1, feature2)
+
+
+def _analyze_multivariate(frame: IngestedFrame, features: list):
+    SimpleMultivariateAnalysis().analyze(frame.select(features))
+
+
+# The same inspections and analyses as the examples in each module (name, task function, task arguments).
+TASKS = [
+    ("data_types", _inspect, (DataTypesInspectionStrategy(),)),
+    ("summary_statistics", _inspect, (SummaryStatisticsInspectionStrategy(),)),
+    ("numerical_statistics", _inspect, (NumericalStatsInspectionStrategy(),)),
+    ("missing_values", _analyze_missing_values, ()),
+    ("univariate_sale_price", _analyze_univariate, (NumericalUnivariateAnalysis(), "SalePrice")),
+    ("univariate_neighborhood", _analyze_univariate, (CategoricalUnivariateAnalysis(), "Neighborhood")),
+    ("bivariate_living_area", _analyze_bivariate, (NumericalVsNumericalAnalysis(), "Gr Liv Area", "SalePrice")),
+    ("bivariate_overall_quality", _analyze_bivariate, (CategoricalVsNumericalAnalysis(), "Overall Qual", "SalePrice")),
+    ("multivariate", _analyze_multivariate, (["SalePrice", "Gr Liv Area", "Overall Qual", "Total Bsmt SF", "Year Built"],)),
+]
+
+
+@functools.lru_cache(maxsize=None)
+def _load_frame(arrow_path: str) -> IngestedFrame:
+    """Memory-maps the Arrow IPC file (without copying its data) and groups its columns, at most once per worker process."""
+    table = pa.ipc.open_file(pa.memory_map(arrow_path)).read_all()
+    return IngestedFrame.from_dataframe(table.to_pandas(types_mapper=pd.ArrowDtype))
+
+
+def _run_task(arrow_path: str, output_dir: str, name: str, task, args) -> str:
+    """
+    Runs a single task in a worker process.
+
+    Parameters:
+    arrow_path (str): The path to the Arrow IPC file holding our data.
+    output_dir (str): The directory where the task's figures are saved.
+    name (str): The task's name (used to name its figures).
+    task (callable): The task function, called as task(frame, *args) with the data's IngestedFrame.
+    args (tuple): The task function's extra arguments.
+
+    Returns:
+    str: Everything the task printed to the console.
+    """
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    # Save each figure instead of showing it.
+    figure_count = 0
+
+    def save_figure(*show_args, **show_kwargs):
+        nonlocal figure_count
+        figure_count += 1
+        plt.gcf().savefig(os.path.join(output_dir, f"{name}-{figure_count}.png"), bbox_inches="tight")
+        plt.close("all")
+
+    plt.show = save_figure
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        task(_load_frame(arrow_path), *args)
+    return output.getvalue()
+
+
+def run_all_analyses(file_path: str, output_dir: str = "analysis_output", max_workers: int = None):
+    """
+    Runs every task in TASKS in parallel on the data in the given ZIP file, printing each task's output in order.
+
+    Parameters:
+    file_path (str): The path to the ZIP file containing our data.
+    output_dir (str): The directory where the figures are saved.
+    max_workers (int): The number of worker processes (defaults to one per task, up to the number of CPUs).
+
+    Returns:
+    None
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    if max_workers is None:
+        max_workers = min(len(TASKS), os.cpu_count() or 1)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        # Ingest once in the parent and write the data uncompressed, so the workers can map it rather than decompress it.
+        # (The Parquet cache is compressed, so each worker reading it would hold its own decompressed copy.)
+        arrow_path = os.path.join(tmp_dir, "data.arrow")
+        pa.feather.write_feather(ZipDataIngestor().ingest(file_path), arrow_path, compression="uncompressed")
+
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                (name, executor.submit(_run_task, arrow_path, output_dir, name, task, args)) for name, task, args in TASKS
+            ]
+            for name, future in futures:
+                print(f"\n===== {name} =====")
+                print(future.result(), end="")
+
+    print(f"\nFigures saved to {output_dir}/")
+
+
+if __name__ == "__main__":
+    # Usage: python run_all_analyses.py [path/to/archive.zip]
+    file_path = sys.argv[1] if len(sys.argv) > 1 else "data/archive.zip"
+    run_all_analyses(file_path)
@@ -0,0 +1,57 @@
+import numba
+import numpy as np
+
+'''
+This module holds Numba-compiled kernels for mean/median imputation of a 2D float array (NaN for missing values).
+Each kernel computes a column's fill value and fills its missing values in native loops, one column per thread,
+instead of dispatching a pandas reduction and fill for every column. The kernels release the GIL while they run.
+The arrays are filled in place and should be column-major (Fortran order), so each column is contiguous in memory.
+'''
+
+
+# The "reassoc"/"contract" fast-math flags let LLVM reorder and vectorize the sum,
+# without the no-NaN assumptions of full fast-math (which would drop our NaN checks).
+@numba.njit(parallel=True, cache=True, nogil=True, fastmath={"reassoc", "contract"})
+def mean_impute(arr):
+    n, m = arr.shape
+    for j in numba.prange(m):
+        total = 0.0
+        count = 0
+        for i in range(n):
+            value = arr[i, j]
+            if not np.isnan(value):
+                total += value
+                count += 1
+        if count == 0:
+            continue  # Columns with no values at all stay missing.
+
+        mean = total / count
+        for i in range(n):
+            if np.isnan(arr[i, j]):
+                arr[i, j] = mean
+
+
+@numba.njit(parallel=True, cache=True, nogil=True)
+def median_impute(arr):
+    n, m = arr.shape
+    for j in numba.prange(m):
+        # Gather the column's values into a scratch buffer to take their median.
+        values = np.empty(n)
+        count = 0
+        for i in range(n):
+            value = arr[i, j]
+            if not np.isnan(value):
+                values[count] = value
+                count += 1
+        if count == 0 or count == n:
+            continue  # Nothing to fill (or nothing to fill with).
+
+        median = np.median(values[:count])
+        for i in range(n):
+            if np.isnan(arr[i, j]):
+                arr[i, j] = median
+
+
+# Compile both kernels at import time (or load them from Numba's on-disk cache), so the first imputation doesn't pay for it.
+mean_impute(np.full((2, 1), np.nan, order="F"))
+median_impute(np.array([[1.0], [np.nan]], order="F"))
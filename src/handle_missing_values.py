@@ -1,113 +1,570 @@
 import logging
+import os
+import sys
+import warnings
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from enum import Enum
+from functools import reduce
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+from src.ingest_data import unwrap_frame
+
+try:
+    import bottleneck as bn
+except ImportError:  # Bottleneck is optional; NumPy's NaN-aware reductions are used without it.
+    bn = None
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 
 
+# Arrow compute helpers
+# -----------------------------------------------------
+# When every column of a DataFrame is Arrow-backed (see ZipDataIngestor), missing values can be handled directly
+# with Arrow's C++ compute kernels on each column's contiguous buffers, rather than going through pandas' block machinery.
+def _is_arrow_backed(df: pd.DataFrame) -> bool:
+    """Returns True if every column of the DataFrame uses a pd.ArrowDtype."""
+    return len(df.columns) > 0 and all(isinstance(dtype, pd.ArrowDtype) for dtype in df.dtypes)
+
+
+def _arrow_drop_rows(df: pd.DataFrame, threshold=None) -> pd.DataFrame:
+    """Drops rows with missing values (or fewer than threshold non-NA values) using Arrow compute kernels."""
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    valid_masks = [pc.is_valid(column) for column in table.columns]
+    if threshold is None:
+        keep = reduce(pc.and_, valid_masks)
+    else:
+        valid_counts = reduce(pc.add, [pc.cast(mask, pa.int32()) for mask in valid_masks])
+        keep = pc.greater_equal(valid_counts, threshold)
+
+    df_cleaned = table.filter(keep).to_pandas(types_mapper=pd.ArrowDtype)
+    df_cleaned.index = df.index[keep.to_numpy(zero_copy_only=False)]
+    return df_cleaned
+
+
+# Frames with at least this many cells have their columns handled in parallel threads (below it, threads cost more than they save).
+_PARALLEL_MIN_CELLS = 32_768
+
+
+def _map_columns(fn, df: pd.DataFrame, *iterables) -> list:
+    """
+    Maps fn over the column names of df (along with any other per-column iterables), in a thread pool for large frames.
+    The columns are independent, and Arrow's kernels (and pandas' hashing) release the GIL, so the threads run concurrently.
+    """
+    if df.size >= _PARALLEL_MIN_CELLS and (os.cpu_count() or 1) > 1:
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            return list(executor.map(fn, df.columns, *iterables))
+    return list(map(fn, df.columns, *iterables))
+
+
+def _arrow_fill(df: pd.DataFrame, fill_values: pd.Series) -> pd.DataFrame:
+    """Fills missing values column by column with the given per-column fill values using Arrow compute kernels."""
+    table = pa.Table.from_pandas(df, preserve_index=False)
+
+    def fill_column(name, column):
+        # Columns without nulls (or without a usable fill value) are passed through untouched.
+        if column.null_count > 0 and name in fill_values.index and not pd.isna(fill_values[name]):
+            # Arrow can't cast a scalar straight to a dictionary type, so dictionary columns get a scalar of their value type.
+            fill_type = column.type.value_type if pa.types.is_dictionary(column.type) else column.type
+            column = pc.fill_null(column, pa.scalar(fill_values[name]).cast(fill_type))
+        return column
+
+    columns = _map_columns(fill_column, df, table.columns)
+    df_cleaned = pa.Table.from_arrays(columns, schema=table.schema).to_pandas(types_mapper=pd.ArrowDtype)
+    df_cleaned.index = df.index
+    return df_cleaned
+
+
+def _nan_stats(arr: np.ndarray, method: str) -> np.ndarray:
+    """
+    Computes the mean/median of each column of a 2D float array, ignoring NaN.
+    Bottleneck's reductions check for NaN and accumulate in a single C loop per column, so we use them when available.
+    """
+    if bn is not None:
+        return bn.nanmean(arr, axis=0) if method == "mean" else bn.nanmedian(arr, axis=0)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)  # Columns with no values at all get a NaN fill value.
+        return np.nanmean(arr, axis=0) if method == "mean" else np.nanmedian(arr, axis=0)
+
+
+def _column_stats(numerical_data: pd.DataFrame, method: str) -> pd.Series:
+    """Computes the mean/median of each numerical column, ignoring missing values."""
+    arr = numerical_data.to_numpy(dtype=np.float64, na_value=np.nan)
+    return pd.Series(_nan_stats(arr, method), index=numerical_data.columns)
+
+
+def _column_modes(df: pd.DataFrame) -> pd.Series:
+    """
+    Computes the mode of each column that has missing values, ignoring missing values.
+    Each column's values are factorized (hashed into integer codes) and counted with np.bincount, a single O(n) pass,
+    rather than sorting and grouping every value as df.mode() does. Like df.mode(), ties go to the smallest value.
+    """
+    null_df = df[df.columns[df.count().to_numpy() < len(df)]]
+
+    def column_mode(col):
+        codes, uniques = pd.factorize(null_df[col], sort=True)
+        counts = np.bincount(codes[codes >= 0])
+        return (col, uniques[counts.argmax()]) if len(counts) > 0 else None  # Columns with no values at all are left as they are.
+
+    return pd.Series(dict(mode for mode in _map_columns(column_mode, null_df) if mode is not None), dtype=object)
+
+
+def _valid_rows(df: pd.DataFrame, cols=None) -> np.ndarray:
+    """
+    Returns a boolean mask of the rows without missing values (only checking cols, if given).
+    The mask is accumulated one column at a time, so the only temporaries are one row long, not a full mask of the frame.
+    """
+    valid = np.ones(len(df), dtype=bool)
+    for col in df.columns if cols is None else cols:
+        series = df[col]
+        if isinstance(series.dtype, np.dtype) and series.dtype.kind == "f":
+            values = series.to_numpy()
+            valid &= values == values  # NaN is the only value that doesn't equal itself.
+        else:
+            valid &= series.notna().to_numpy()
+    return valid
+
+
+def _fill_inplace(df: pd.DataFrame, df_cleaned: pd.DataFrame) -> pd.DataFrame:
+    """Writes the filled columns of df_cleaned back into df itself (replacing only those columns) and returns df."""
+    filled_cols = df.columns[df.count().to_numpy() != df_cleaned.count().to_numpy()]
+    for col in filled_cols:
+        df[col] = df_cleaned[col]
+    return df
+
+
+def _with_fill_category(df: pd.DataFrame, fill_value, inplace=False) -> pd.DataFrame:
+    """
+    Adds a constant fill value to the categories of the categorical columns with missing values that don't have it yet,
+    since pandas can't fill a categorical with a value outside its categories. Without inplace, df itself is left unchanged.
+    """
+    cols = [
+        col for col, dtype in df.dtypes.items()
+        if isinstance(dtype, pd.CategoricalDtype) and fill_value not in dtype.categories and df[col].hasnans
+    ]
+    if len(cols) > 0 and not inplace:
+        df = df.copy(deep=False)
+    for col in cols:
+        df[col] = df[col].cat.add_categories([fill_value])
+    return df
+
+
+def _fill_pandas(df: pd.DataFrame, method: str, fill_value=None, numerical_cols=None, inplace=False) -> pd.DataFrame:
+    """
+    Fills missing values with pandas/Arrow using the given method ('mean', 'median', 'mode', or 'constant').
+    This is FillMissingValuesStrategy's pandas implementation, also called directly by handle_missing_values_step.
+    For mean/median, only the numerical columns (numerical_cols, if already known) are filled.
+    """
+    # Each branch computes the fill values; the fill itself returns a new DataFrame, so we don't copy the input up front.
+    if method in ("mean", "median"):
+        # Only numerical columns are to be filled with their mean/median (the Series of fill values only covers those columns).
+        numerical_data = df[numerical_cols] if numerical_cols is not None else df.select_dtypes(include="number")
+        fill_values = _column_stats(numerical_data, method)
+    elif method == "mode":
+        # For both numerical and categorical columns, we fill with the mode.
+        fill_values = _column_modes(df)
+    else:
+        # Fill all columns with the constant value (categorical columns first get it as a new category).
+        df = _with_fill_category(df, fill_value, inplace=inplace)
+        fill_values = fill_value
+
+    if _is_arrow_backed(df) and fill_values is not None:
+        if not isinstance(fill_values, pd.Series):
+            fill_values = pd.Series(fill_values, index=df.columns)
+        if inplace:
+            # Only the columns with nulls (which Arrow already counts) and a fill value are filled, then assigned straight back.
+            null_cols = df.columns[df.count().to_numpy() < len(df)]
+            fill_cols = [col for col in null_cols if col in fill_values.index and not pd.isna(fill_values[col])]
+            if len(fill_cols) > 0:
+                filled = _arrow_fill(df[fill_cols], fill_values)
+                for col in fill_cols:
+                    df[col] = filled[col]
+            df_cleaned = df
+        else:
+            df_cleaned = _arrow_fill(df, fill_values)
+    elif inplace:
+        df.fillna(fill_values, inplace=True)
+        df_cleaned = df
+    else:
+        df_cleaned = df.fillna(fill_values)
+    return df_cleaned
+
+
+# Lazy backends
+# -----------------------------------------------------
+# Missing value handling can also be pushed down to Polars' or DuckDB's columnar, multithreaded engines.
+# Both libraries are optional and are only imported when their backend is selected.
+class LazyBackend(Enum):
+    PANDAS = "pandas"
+    POLARS = "polars"
+    DUCKDB = "duckdb"
+
+
+_ROW_NUMBER_COL = "__row_number__"
+
+
+def _table_to_pandas(table: pa.Table, like: pd.DataFrame, index: pd.Index) -> pd.DataFrame:
+    """Converts an Arrow table back to pandas, keeping Arrow-backed dtypes if the original DataFrame used them."""
+    if not any(isinstance(dtype, pd.ArrowDtype) for dtype in like.dtypes):
+        df_cleaned = table.to_pandas()
+    else:
+        # Polars/DuckDB may return text as large/view strings (and re-encode or decode dictionaries), so we restore the original types.
+        for i, (field, dtype) in enumerate(zip(table.schema, like.dtypes)):
+            if not isinstance(dtype, pd.ArrowDtype) or field.type == dtype.pyarrow_dtype:
+                continue
+            if pa.types.is_string(dtype.pyarrow_dtype):
+                table = table.set_column(i, field.name, table.column(i).cast(dtype.pyarrow_dtype))
+            elif pa.types.is_dictionary(dtype.pyarrow_dtype):
+                column = table.column(i)
+                if not pa.types.is_dictionary(field.type):
+                    column = column.cast(dtype.pyarrow_dtype.value_type)  # e.g. view strings can't be dictionary-encoded directly.
+                table = table.set_column(i, field.name, column.cast(dtype.pyarrow_dtype))
+        # Dictionary-encoded columns go back to pandas categoricals, unless they were Arrow-backed dictionaries to begin with
+        # (see ZipDataIngestor._compact_dtypes); everything else stays Arrow-backed.
+        arrow_dictionary_types = {
+            dtype.pyarrow_dtype for dtype in like.dtypes
+            if isinstance(dtype, pd.ArrowDtype) and pa.types.is_dictionary(dtype.pyarrow_dtype)
+        }
+        df_cleaned = table.to_pandas(
+            types_mapper=lambda t: None if pa.types.is_dictionary(t) and t not in arrow_dictionary_types else pd.ArrowDtype(t)
+        )
+
+    # Engines that don't round-trip pandas categoricals return them as plain strings, so we restore the categories
+    # (along with any new value a constant fill added, which would otherwise be turned back into a missing value).
+    for col, dtype in like.dtypes.items():
+        if isinstance(dtype, pd.CategoricalDtype) and df_cleaned[col].dtype != dtype:
+            values = df_cleaned[col]
+            new_categories = pd.Index(values.dropna().unique()).difference(dtype.categories)
+            df_cleaned[col] = values.astype(pd.CategoricalDtype(dtype.categories.append(new_categories), dtype.ordered))
+    df_cleaned.index = index
+    return df_cleaned
+
+
+def _quote(col) -> str:
+    """Quotes a column name for use as a DuckDB identifier."""
+    return '"' + str(col).replace('"', '""') + '"'
+
+
+def _polars_fill_exprs(cols, method: str, fill_value, schema) -> list:
+    """Builds the Polars expressions that fill the given columns' missing values."""
+    import polars as pl
+
+    if method == "mean":
+        return [pl.col(col).fill_null(pl.col(col).mean()) for col in cols]
+    if method == "median":
+        return [pl.col(col).fill_null(pl.col(col).median()) for col in cols]
+    if method == "mode":
+        # Like pandas, we ignore nulls and use the smallest value when a column has several modes.
+        return [pl.col(col).fill_null(pl.col(col).drop_nulls().mode().sort().first()) for col in cols]
+    # Polars categoricals only hold strings, so the constant is cast to them from its text.
+    return [
+        pl.col(col).fill_null(pl.lit(str(fill_value) if schema[col] == pl.Categorical else fill_value).cast(schema[col]))
+        for col in cols
+    ]
+
+
+def _polars_fill(df: pd.DataFrame, method: str, fill_value=None) -> pd.DataFrame:
+    """Fills missing values with Polars' fill_null."""
+    import polars as pl
+
+    pl_df = pl.from_pandas(df)
+
+    # Only columns that actually contain nulls are filled (for mean/median, only the numerical ones).
+    null_cols = [col for col, count in zip(pl_df.columns, pl_df.null_count().row(0)) if count > 0]
+    if method in ("mean", "median"):
+        null_cols = [col for col in null_cols if pl_df.schema[col].is_numeric()]
+
+    fills = _polars_fill_exprs(null_cols, method, fill_value, pl_df.schema)
+    return _table_to_pandas(pl_df.with_columns(fills).to_arrow(), df, df.index)
+
+
+def _polars_drop(df: pd.DataFrame, axis=0, threshold=None) -> pd.DataFrame:
+    """Drops rows/columns with missing values using Polars."""
+    import polars as pl
+
+    pl_df = pl.from_pandas(df)
+    min_valid = pl_df.width if axis == 0 else pl_df.height
+    min_valid = min_valid if threshold is None else threshold
+    if axis == 1:
+        valid_counts = pl_df.select(pl.all().count()).row(0)
+        return df.loc[:, [count >= min_valid for count in valid_counts]]
+
+    pl_df = pl_df.with_row_index(_ROW_NUMBER_COL).filter(
+        pl.sum_horizontal(pl.all().exclude(_ROW_NUMBER_COL).is_not_null()) >= min_valid
+    )
+    row_numbers = pl_df.get_column(_ROW_NUMBER_COL).to_numpy()
+    return _table_to_pandas(pl_df.drop(_ROW_NUMBER_COL).to_arrow(), df, df.index[row_numbers])
+
+
+# A Polars LazyFrame (see ZipDataIngestor.scan_polars) is handled by adding the fill/drop to its query plan,
+# so that reading the data and handling its missing values run together as a single (streaming) query.
+def _is_polars_lazy(df) -> bool:
+    """Returns True if df is a Polars LazyFrame (without importing Polars if it isn't loaded already)."""
+    pl = sys.modules.get("polars")
+    return pl is not None and isinstance(df, pl.LazyFrame)
+
+
+def _polars_lazy_fill(lf, method: str, fill_value=None):
+    """Adds a fill of the missing values to a Polars LazyFrame's query plan."""
+    schema = lf.collect_schema()
+    if method in ("mean", "median"):
+        # Ingestion promotes integer columns with missing values to floats, so only float columns can need a mean/median.
+        cols = [col for col, dtype in schema.items() if dtype.is_float()]
+    else:
+        cols = schema.names()
+    return lf.with_columns(_polars_fill_exprs(cols, method, fill_value, schema))
+
+
+def _polars_lazy_drop(lf, axis=0, threshold=None):
+    """Adds a drop of the rows with missing values to a Polars LazyFrame's query plan."""
+    import polars as pl
+
+    if axis != 0:
+        raise ValueError("Only rows (axis=0) can be dropped from a Polars LazyFrame.")
+    min_valid = lf.collect_schema().len() if threshold is None else threshold
+    return lf.filter(pl.sum_horizontal(pl.all().is_not_null()) >= min_valid)
+
+
+def _duckdb_query(df: pd.DataFrame, build_query):
+    """Registers the DataFrame (plus its row numbers) as a DuckDB view and runs the query returned by build_query."""
+    import duckdb
+
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    table = table.append_column(_ROW_NUMBER_COL, pa.array(np.arange(len(df))))
+    with duckdb.connect() as con:
+        con.register("df_view", table)
+        col_types = {row[0]: row[1] for row in con.execute("DESCRIBE df_view").fetchall()}
+        query, params = build_query(table, col_types)
+        return con.execute(query, params).fetch_arrow_table()
+
+
+def _duckdb_fill(df: pd.DataFrame, method: str, fill_value=None) -> pd.DataFrame:
+    """Fills missing values with window aggregates (e.g. COALESCE(col, AVG(col) OVER ())) in DuckDB."""
+    numerical_cols = set(df.select_dtypes(include="number").columns)
+    aggregates = {"mean": "AVG", "median": "MEDIAN", "mode": "MODE"}
+
+    def build_query(table, col_types):
+        select = []
+        for col, column in zip(df.columns, table.columns):
+            fillable = method in ("mode", "constant") or col in numerical_cols
+            if column.null_count == 0 or not fillable:
+                select.append(_quote(col))
+            elif method == "constant":
+                select.append(f"COALESCE({_quote(col)}, CAST($fill_value AS {col_types[col]})) AS {_quote(col)}")
+            else:
+                fill = f"{aggregates[method]}({_quote(col)}) OVER ()"
+                select.append(f"CAST(COALESCE({_quote(col)}, {fill}) AS {col_types[col]}) AS {_quote(col)}")
+        query = f"SELECT {', '.join(select)} FROM df_view ORDER BY {_ROW_NUMBER_COL}"
+        return query, ({"fill_value": fill_value} if method == "constant" else {})
+
+    return _table_to_pandas(_duckdb_query(df, build_query), df, df.index)
+
+
+def _duckdb_drop(df: pd.DataFrame, axis=0, threshold=None) -> pd.DataFrame:
+    """Drops rows/columns with missing values using DuckDB."""
+    min_valid = df.shape[1] if axis == 0 else len(df)
+    min_valid = min_valid if threshold is None else threshold
+    if axis == 1:
+        counts = _duckdb_query(df, lambda table, col_types: (
+            f"SELECT {', '.join(f'COUNT({_quote(col)})' for col in df.columns)} FROM df_view", {}
+        ))
+        return df.loc[:, [counts.column(i)[0].as_py() >= min_valid for i in range(df.shape[1])]]
+
+    valid_counts = " + ".join(f"CAST({_quote(col)} IS NOT NULL AS INTEGER)" for col in df.columns)
+    result = _duckdb_query(df, lambda table, col_types: (
+        f"SELECT * FROM df_view WHERE {valid_counts} >= {int(min_valid)} ORDER BY {_ROW_NUMBER_COL}", {}
+    ))
+    row_numbers = result.column(_ROW_NUMBER_COL).to_numpy()
+    return _table_to_pandas(result.drop_columns([_ROW_NUMBER_COL]), df, df.index[row_numbers])
+
+
 # An abstract class that will define our missing value handling interface.
 class MissingValueHandlingStrategy(ABC):
     @abstractmethod
-    def handle(self, df: pd.DataFrame) -> pd.DataFrame:
+    def handle(self, df: pd.DataFrame, inplace=False) -> pd.DataFrame:
         """
         Abstract method to handle missing values in the DataFrame.
 
         Parameters:
         df (pd.DataFrame): The DataFrame containing missing values to be handled.
+        inplace (bool): If True, df itself is modified (and returned) instead of building a new DataFrame.
 
         Returns:
         pd.DataFrame: The cleaned DataFrame with missing values handled.
         """
         pass
 
+    def handle_array(self, arr: np.ndarray, columns: pd.Index, index: pd.Index):
+        """
+        Handles missing values in a 2D array holding a DataFrame's values (NaN for missing values).
+        By default, the array is wrapped in a DataFrame for handle(); strategies can override this to work on the array directly.
+
+        Parameters:
+        arr (np.ndarray): The 2D array (rows x columns) containing missing values to be handled.
+        columns (pd.Index): The column labels of the array.
+        index (pd.Index): The row labels of the array.
+
+        Returns:
+        tuple: The cleaned array along with its (possibly reduced) column and row labels.
+        """
+        df_cleaned = self.handle(pd.DataFrame(arr, index=index, columns=columns, copy=False))
+        return df_cleaned.to_numpy(), df_cleaned.columns, df_cleaned.index
+
 
 # Our first concrete strategy: Drop Missing Values
 # -----------------------------------------------------
 # This strategy drops rows or columns with missing values based on the specified axis and threshold.
 # If the number of non-NA values in a row/column is less than the threshold, the given row/column will be dropped.
 class DropMissingValuesStrategy(MissingValueHandlingStrategy):
-    def __init__(self, axis=0, threshold=None):
+    def __init__(self, axis=0, threshold=None, backend=LazyBackend.PANDAS):
         """
         Initializes the DropMissingValuesStrategy with the specified axis and threshold.
 
         Parameters:
         axis (int): 0 or 1 -> 0 for dropping rows w/ missing values, 1 for dropping columns w/ missing values.
         threshold (int): The threshold for non-NA values. Rows/Columns with less than threshold non-NA values are dropped.
+        backend (LazyBackend): The engine used to drop missing values (pandas, Polars, or DuckDB).
         """
         self.axis = axis
         self.threshold = threshold
+        self.backend = backend
 
-    def handle(self, df: pd.DataFrame) -> pd.DataFrame:
+    def handle(self, df: pd.DataFrame, inplace=False) -> pd.DataFrame:
         """
         Drops rows/columns w/ missing values based on the provided axis and threshold.
 
         Parameters:
-        df (pd.DataFrame): The DataFrame containing missing values to be handled.
+        df (pd.DataFrame): The DataFrame containing missing values to be handled (or an IngestedFrame wrapping it, or a Polars LazyFrame).
+        inplace (bool): If True, the rows/columns are dropped from df itself (using pandas), and df is returned.
 
         Returns:
-        pd.DataFrame: The cleaned DataFrame with missing values dropped.
+        pd.DataFrame: The cleaned DataFrame with missing values dropped (for a LazyFrame, a LazyFrame that drops them).
         """
         logging.info(f"Dropping missing values with axis={self.axis} and threshold={self.threshold}")
-        df_cleaned = df.dropna(axis=self.axis, thresh=self.threshold)
+        if _is_polars_lazy(df):
+            return _polars_lazy_drop(df, self.axis, self.threshold)
+        df, _ = unwrap_frame(df)
+
+        # Recent pandas versions treat an explicit thresh=None as a threshold, so we only pass it when one is set.
+        thresh_kwargs = {} if self.threshold is None else {"thresh": self.threshold}
+        if inplace:
+            df.dropna(axis=self.axis, inplace=True, **thresh_kwargs)
+            df_cleaned = df
+        elif self.backend is LazyBackend.POLARS:
+            df_cleaned = _polars_drop(df, self.axis, self.threshold)
+        elif self.backend is LazyBackend.DUCKDB:
+            df_cleaned = _duckdb_drop(df, self.axis, self.threshold)
+        elif not _is_arrow_backed(df) and self.axis == 0 and self.threshold is None:
+            df_cleaned = df[_valid_rows(df)]
+        elif not _is_arrow_backed(df):
+            df_cleaned = df.dropna(axis=self.axis, **thresh_kwargs)
+        elif self.axis == 0:
+            df_cleaned = _arrow_drop_rows(df, self.threshold)
+        else:
+            # Arrow tracks each column's null count as metadata, so dropping columns needs no scan at all.
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            min_valid = len(df) if self.threshold is None else self.threshold
+            df_cleaned = df.loc[:, [len(df) - column.null_count >= min_valid for column in table.columns]]
         logging.info("Missing values dropped.")
         return df_cleaned
 
+    def handle_array(self, arr: np.ndarray, columns: pd.Index, index: pd.Index):
+        """
+        Drops rows/columns w/ missing values from a 2D float array, using a count of the valid values per row/column.
+        Like _valid_rows, the counts are built one column at a time, so no full missing-value mask of the array is allocated.
+        Non-float arrays are handled through handle().
+        """
+        if arr.dtype.kind != "f" or self.backend is not LazyBackend.PANDAS:
+            return super().handle_array(arr, columns, index)
+
+        logging.info(f"Dropping missing values with axis={self.axis} and threshold={self.threshold}")
+        columns_valid = (arr[:, j] == arr[:, j] for j in range(arr.shape[1]))  # NaN is the only value that doesn't equal itself.
+        if self.axis == 0:
+            valid_counts = np.zeros(arr.shape[0], dtype=np.intp)
+            for column_valid in columns_valid:
+                valid_counts += column_valid
+        else:
+            valid_counts = np.fromiter((np.count_nonzero(column_valid) for column_valid in columns_valid), np.intp, arr.shape[1])
+        keep = valid_counts >= (arr.shape[1 - self.axis] if self.threshold is None else self.threshold)
+        logging.info("Missing values dropped.")
+        if self.axis == 0:
+            return arr[keep], columns, index[keep]
+        return arr[:, keep], columns[keep], index
+
 
 # Our second concrete strategy: Fill Missing Values
 # -----------------------------------------------------
 # This strategy fills missing values using a specified method (mean, median, mode, or constant).
 # If the method is 'constant', a specific fill value can be provided.
 class FillMissingValuesStrategy(MissingValueHandlingStrategy):
-    def __init__(self, method="mean", fill_value=None):
+    def __init__(self, method="mean", fill_value=None, backend=LazyBackend.PANDAS):
         """
         Initializes the FillMissingValuesStrategy with a specific method or fill value.
 
         Parameters:
         method (str): The method for filling missing values. Options are ('mean', 'median', 'mode', 'constant').
         fill_value (any): If the method is 'constant', a specific fill value can be provided.
+        backend (LazyBackend): The engine used to fill missing values (pandas, Polars, or DuckDB).
         """
         self.method = method
         self.fill_value = fill_value
+        self.backend = backend
 
-    def handle(self, df: pd.DataFrame) -> pd.DataFrame:
+    def handle(self, df: pd.DataFrame, inplace=False) -> pd.DataFrame:
         """
         Fills missing values using the specified method or constant value.
 
         Parameters:
-        df (pd.DataFrame): The DataFrame containing missing values to be handled.
+        df (pd.DataFrame): The DataFrame containing missing values to be handled (or an IngestedFrame wrapping it, or a Polars LazyFrame).
+        inplace (bool): If True, the filled columns are written back into df itself, and df is returned.
 
         Returns:
-        pd.DataFrame: The cleaned DataFrame with missing values filled.
+        pd.DataFrame: The cleaned DataFrame with missing values filled (for a LazyFrame, a LazyFrame that fills them).
         """
         logging.info(f"Filling missing values using method: {self.method}")
 
-        df_cleaned = df.copy()
-        if self.method == "mean":
-            # Only numerical columns are to be filled with their mean.
-            numerical_cols = df_cleaned.select_dtypes(include="number").columns # The names of our numerical columns
-            df_cleaned[numerical_cols] = df_cleaned[numerical_cols].fillna(
-                df[numerical_cols].mean()
-            )
-        elif self.method == "median":
-            # Only numerical columns are to be filled with their median.
-            numerical_cols = df_cleaned.select_dtypes(include="number").columns # The names of our numerical columns
-            df_cleaned[numerical_cols] = df_cleaned[numerical_cols].fillna(
-                df[numerical_cols].median()
-            )
-        elif self.method == "mode":
-            # For both numerical and categorical columns, we fill with the mode.
-            for col in df_cleaned.columns:
-                df_cleaned[col].fillna(df[col].mode().iloc[0], inplace=True)
-        elif self.method == "constant":
-            # Fill all columns with the constant value.
-            df_cleaned = df_cleaned.fillna(self.fill_value)
-        else:
+        if _is_polars_lazy(df) and self.method in ("mean", "median", "mode", "constant"):
+            return _polars_lazy_fill(df, self.method, self.fill_value)
+
+        # An IngestedFrame already knows its numerical columns, so we don't need to re-scan the dtypes.
+        df, numerical_cols = unwrap_frame(df)
+
+        if self.backend is not LazyBackend.PANDAS and self.method in ("mean", "median", "mode", "constant"):
+            fill = _polars_fill if self.backend is LazyBackend.POLARS else _duckdb_fill
+            df_cleaned = fill(df, self.method, self.fill_value)
+            logging.info("Missing values filled.")
+            return _fill_inplace(df, df_cleaned) if inplace else df_cleaned
+
+        if self.method not in ("mean", "median", "mode", "constant"):
             logging.warning(f"'{self.method}' is an unknown method... No missing values handled.")
+            return df
 
+        df_cleaned = _fill_pandas(df, self.method, self.fill_value, numerical_cols, inplace=inplace)
         logging.info("Missing values filled.")
         return df_cleaned
 
+    def handle_array(self, arr: np.ndarray, columns: pd.Index, index: pd.Index):
+        """
+        Fills the missing values of a 2D float array in place with a masked np.copyto (for the mean, median, and constant methods).
+        Non-float arrays and other methods are handled through handle().
+        """
+        if (
+            arr.dtype.kind != "f"
+            or self.backend is not LazyBackend.PANDAS
+            or self.method not in ("mean", "median", "constant")
+            or (self.method == "constant" and not isinstance(self.fill_value, (int, float)))
+        ):
+            return super().handle_array(arr, columns, index)
+
+        logging.info(f"Filling missing values using method: {self.method}")
+        fill_values = self.fill_value if self.method == "constant" else _nan_stats(arr, self.method)
+        np.copyto(arr, np.broadcast_to(np.asarray(fill_values, dtype=arr.dtype), arr.shape), where=np.isnan(arr))
+        logging.info("Missing values filled.")
+        return arr, columns, index
+
 
 # Our conext class that allows us to switch between different missing value handling strategies.
 # This class uses the Strategy Design Pattern to allow for flexible missing value handling.
@@ -131,18 +588,35 @@ class MissingValueHandler:
         logging.info("Switching to a new missing value handling strategy.")
         self._strategy = strategy
 
-    def handle_missing_values(self, df: pd.DataFrame) -> pd.DataFrame:
+    def handle_missing_values(self, df: pd.DataFrame, inplace=False) -> pd.DataFrame:
         """
         Executes the current missing value handling strategy on the provided DataFrame.
 
         Parameters:
         df (pd.DataFrame): The DataFrame containing missing values to be handled.
+        inplace (bool): If True, df itself is modified (saving a copy of the data) and returned.
 
         Returns:
         pd.DataFrame: The cleaned DataFrame with missing values handled according to the current strategy.
         """
         logging.info("Executing the current missing value handling strategy.")
-        return self._strategy.handle(df)
+        return self._strategy.handle(df, inplace=inplace)
+
+    def handle_missing_values_array(self, arr: np.ndarray, columns: pd.Index, index: pd.Index):
+        """
+        Executes the current missing value handling strategy on a 2D array of a DataFrame's values.
+        This lets callers keep working with plain arrays and build a DataFrame only once, at the end.
+
+        Parameters:
+        arr (np.ndarray): The 2D array (rows x columns) containing missing values to be handled (float arrays may be filled in place).
+        columns (pd.Index): The column labels of the array.
+        index (pd.Index): The row labels of the array.
+
+        Returns:
+        tuple: The cleaned array along with its column and row labels, as (arr, columns, index).
+        """
+        logging.info("Executing the current missing value handling strategy.")
+        return self._strategy.handle_array(arr, columns, index)
 
 
 # Example usage of the MissingValueHandler with different strategies.
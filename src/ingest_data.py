@@ -1,7 +1,80 @@
 import os
+import tempfile
 import zipfile
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+
+
+# The markers pandas' CSV reader treats as missing values by default (in text columns too), which we keep for Arrow's reader.
+PANDAS_NA_VALUES = [
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan", "1.#IND", "1.#QNAN",
+    "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a", "nan", "null",
+]
+
+
+# The dtype of compacted low-cardinality text columns: dictionary-encoded (categorical) strings that stay Arrow-backed.
+ARROW_DICTIONARY_DTYPE = pd.ArrowDtype(pa.dictionary(pa.int32(), pa.string()))
+
+
+# An ingested DataFrame along with its column groups, computed once at load time.
+# Downstream strategies can use these groups directly instead of re-scanning the dtypes with select_dtypes.
+@dataclass
+class IngestedFrame:
+    df: pd.DataFrame
+    numeric_cols: list[str]
+    categorical_cols: list[str]
+    bool_cols: list[str]
+
+    @classmethod
+    def from_dataframe(cls, df: pd.DataFrame) -> "IngestedFrame":
+        """Partitions the DataFrame's columns into numerical, categorical (text/category), and boolean groups."""
+        numeric_cols, categorical_cols, bool_cols = [], [], []
+        for col, dtype in df.dtypes.items():
+            if pd.api.types.is_bool_dtype(dtype):
+                bool_cols.append(col)
+            elif pd.api.types.is_numeric_dtype(dtype):
+                numeric_cols.append(col)
+            else:
+                categorical_cols.append(col)
+        return cls(df, numeric_cols, categorical_cols, bool_cols)
+
+    def select(self, columns) -> "IngestedFrame":
+        """Returns an IngestedFrame holding only the given columns, keeping their groups (without re-scanning the dtypes)."""
+        columns = set(columns)
+        return IngestedFrame(
+            self.df[[col for col in self.df.columns if col in columns]],
+            [col for col in self.numeric_cols if col in columns],
+            [col for col in self.categorical_cols if col in columns],
+            [col for col in self.bool_cols if col in columns],
+        )
+
+
+def unwrap_frame(data):
+    """
+    Returns the pandas DataFrame behind a DataFrame or an IngestedFrame, along with its numerical columns
+    (None for a plain DataFrame, whose columns haven't been grouped).
+    """
+    if isinstance(data, IngestedFrame):
+        return data.df, data.numeric_cols
+    if isinstance(data, pd.DataFrame):
+        return data, None
+    raise TypeError(f"Expected a pandas DataFrame or an IngestedFrame, but got {type(data).__name__}.")
+
+
+def to_arrow_backed(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Converts every column that isn't already Arrow-backed (or categorical) to a pd.ArrowDtype of the same type.
+    Unlike df.convert_dtypes(), float columns stay floats even if all of their values happen to be whole numbers.
+    """
+    df = df.copy(deep=False)
+    for col, dtype in df.dtypes.items():
+        if not isinstance(dtype, (pd.ArrowDtype, pd.CategoricalDtype)):
+            df[col] = pd.Series(pd.arrays.ArrowExtensionArray(pa.array(df[col], from_pandas=True)), index=df.index)
+    return df
 
 
 # An abstract class that will define our data ingestion interface.
@@ -11,44 +84,200 @@ class DataIngestor(ABC):
         """Abstract method to ingest data from a given file."""
         pass
 
+    def ingest_frame(self, file_path: str) -> IngestedFrame:
+        """Ingests data from a given file and returns it together with its precomputed column groups."""
+        return IngestedFrame.from_dataframe(self.ingest(file_path))
+
 
 # ZIP ingestion implementation:
 class ZipDataIngestor(DataIngestor):
+    def __init__(self, categorical_cols=None, cache_dir="extracted_data", compact_dtypes=False, use_cache=True, block_size=64 << 20):
+        """
+        Initializes the ZipDataIngestor.
+
+        Parameters:
+        categorical_cols (list): Optional low-cardinality columns (e.g. 'Neighborhood', 'MS Zoning') to store as 'category'.
+        cache_dir (str): Directory where parsed data is cached as Parquet to skip re-parsing the CSV on later runs.
+        compact_dtypes (bool): If True, numerical columns are narrowed and low-cardinality text columns are dictionary-encoded.
+        use_cache (bool): If False, the CSV is always parsed and the Parquet cache is neither read nor written.
+        block_size (int): The number of bytes of CSV parsed at a time (bounds the parser's memory use).
+        """
+        self.categorical_cols = categorical_cols or []
+        self.cache_dir = cache_dir
+        self.compact_dtypes = compact_dtypes
+        self.use_cache = use_cache
+        self.block_size = block_size
+
     def ingest(self, file_path: str) -> pd.DataFrame:
-        """Extracts a .zip file and returns the content as a pandas DataFrame."""
+        """Reads the CSV file inside a .zip archive and returns its content as a pandas DataFrame."""
         # Ensure the file has a .zip extension
         if not file_path.endswith(".zip"):
             raise ValueError("The provided file is not a .zip file.")
 
-        # Extract the ZIP file
+        # Reuse the parsed data from a previous run if the archive hasn't changed since.
+        cache_path = self.get_cache_path(file_path)
+        if self.use_cache and os.path.exists(cache_path):
+            df = pd.read_parquet(cache_path, dtype_backend="pyarrow", memory_map=True)
+        else:
+            df = self._read_csv_from_zip(file_path)
+            if self.use_cache:
+                os.makedirs(self.cache_dir, exist_ok=True)
+                df.to_parquet(cache_path, compression="zstd")
+
+        # Store the requested low-cardinality columns as categoricals.
+        for col in self.categorical_cols:
+            df[col] = df[col].astype("category")
+
+        if self.compact_dtypes:
+            df = self._compact_dtypes(df)
+
+        # Return the DataFrame
+        return df
+
+    def ingest_polars(self, file_path: str):
+        """
+        Reads the CSV file inside a .zip archive like ingest(), but returns its content as a Polars DataFrame.
+        Polars reads the Parquet cache directly (written by ingest() on the first run) and is only imported when this is used.
+        Dtype compaction isn't applied here.
+        """
+        return self.scan_polars(file_path).collect()
+
+    def scan_polars(self, file_path: str):
+        """
+        Like ingest_polars(), but returns a Polars LazyFrame.
+        Later operations (e.g. filling missing values) are added to its query plan and run together when it's collected.
+        The Parquet cache is scanned if there is one; otherwise, the CSV is scanned straight out of the archive (see _scan_csv).
+        """
+        import polars as pl
+
+        if not file_path.endswith(".zip"):
+            raise ValueError("The provided file is not a .zip file.")
+
+        cache_path = self.get_cache_path(file_path)
+        if self.use_cache and os.path.exists(cache_path):
+            lf = pl.scan_parquet(cache_path)
+        else:
+            lf = self._scan_csv(file_path)
+        return lf.with_columns(pl.col(self.categorical_cols).cast(pl.Categorical))
+
+    def get_cache_path(self, file_path: str) -> str:
+        """
+        Returns the Parquet cache path for a .zip file, keyed on the archive's name, size, and modification time.
+        Checking these (rather than hashing the archive's contents) keeps a cache hit down to a single stat call.
+        """
+        basename = os.path.splitext(os.path.basename(file_path))[0]
+        stat = os.stat(file_path)
+        return os.path.join(self.cache_dir, f"{basename}.{stat.st_size}-{stat.st_mtime_ns}.parquet")
+
+    def _compact_dtypes(self, df: pd.DataFrame, max_unique_ratio=0.5) -> pd.DataFrame:
+        """
+        Narrows column dtypes to reduce the memory (and bandwidth) used by every downstream operation.
+
+        Float columns become float32, integer columns use the smallest integer width that holds their values
+        (float32 can't represent large IDs such as 'PID' exactly), and text columns where fewer than
+        max_unique_ratio of the values are distinct become dictionary-encoded. Unlike pandas' 'category' dtype,
+        these stay Arrow-backed (keeping Arrow's null bitmaps), and can be filled with values that aren't in their dictionary yet.
+        """
+        for col in df.columns:
+            dtype = df[col].dtype
+            if not isinstance(dtype, pd.ArrowDtype):
+                continue
+
+            if pa.types.is_floating(dtype.pyarrow_dtype):
+                df[col] = df[col].astype(pd.ArrowDtype(pa.float32()))
+            elif pa.types.is_integer(dtype.pyarrow_dtype) and not df[col].hasnans:
+                col_min, col_max = df[col].min(), df[col].max()
+                for int_type in (np.int8, np.int16, np.int32):
+                    if np.iinfo(int_type).min <= col_min and col_max <= np.iinfo(int_type).max:
+                        df[col] = df[col].astype(pd.ArrowDtype(pa.from_numpy_dtype(int_type)))
+                        break
+            elif pa.types.is_string(dtype.pyarrow_dtype) or pa.types.is_large_string(dtype.pyarrow_dtype):
+                if df[col].nunique(dropna=True) / max(len(df), 1) < max_unique_ratio:
+                    df[col] = df[col].astype(ARROW_DICTIONARY_DTYPE)
+
+        return df
+
+    def _scan_csv(self, file_path: str):
+        """
+        Returns a Polars LazyFrame scanning the CSV file inside a .zip archive with pl.scan_csv.
+        The CSV is only parsed when the query is collected, so it's decompressed into memory (and freed along with the LazyFrame)
+        rather than extracted to disk, which would leave a copy behind for every archive version.
+        """
+        import polars as pl
+
         with zipfile.ZipFile(file_path, "r") as zip_ref:
-            zip_ref.extractall("extracted_data")
+            csv_bytes = zip_ref.read(_find_csv(zip_ref))
 
-        # Extract the CSV file (assuming there's at least one CSV file in the zip)
-        extracted_files = os.listdir("extracted_data")
-        csv_files = [f for f in extracted_files if f.endswith(".csv")]
+        # Column types are inferred from the whole file (like the Arrow reader's fallback), with pandas' missing value markers.
+        lf = pl.scan_csv(csv_bytes, null_values=PANDAS_NA_VALUES, infer_schema_length=None)
 
-        if len(csv_files) == 0:
-            raise FileNotFoundError("No CSV file found in the extracted data.")
-        if len(csv_files) > 1:
-            raise ValueError("Multiple CSV files found. Please specify which one to use.")
+        # Like _read_csv_from_zip, integer columns with missing values are promoted to floats (for mean/median imputation).
+        # Finding them only reads the integer columns' null counts, not the whole table.
+        int_cols = [col for col, dtype in lf.collect_schema().items() if dtype.is_integer()]
+        if len(int_cols) > 0:
+            null_counts = lf.select(pl.col(int_cols).null_count()).collect().row(0)
+            lf = lf.with_columns(pl.col(col).cast(pl.Float64) for col, count in zip(int_cols, null_counts) if count > 0)
+        return lf
 
-        # Read the CSV into a DataFrame
-        csv_file_path = os.path.join("extracted_data", csv_files[0])
-        df = pd.read_csv(csv_file_path)
+    def _read_csv_from_zip(self, file_path: str) -> pd.DataFrame:
+        """Parses the CSV file inside a .zip archive into a DataFrame."""
+        with zipfile.ZipFile(file_path, "r") as zip_ref:
+            csv_name = _find_csv(zip_ref)
+
+            # Stream the CSV straight out of the archive (no extraction to disk) through Arrow's incremental CSV reader.
+            # It parses one block at a time, so the parser's working set is bounded by block_size instead of the file size.
+            convert_options = pa_csv.ConvertOptions(null_values=PANDAS_NA_VALUES, strings_can_be_null=True)
+            try:
+                with zip_ref.open(csv_name) as csv_file:
+                    reader = pa_csv.open_csv(
+                        csv_file,
+                        read_options=pa_csv.ReadOptions(block_size=self.block_size),
+                        convert_options=convert_options,
+                    )
+                    table = pa.Table.from_batches(list(reader), schema=reader.schema)
+            except pa.ArrowInvalid:
+                # Column types are inferred from the first block; if a later block doesn't fit them, parse the whole file at once.
+                # For this, we extract the CSV to a temporary file and memory-map it, so the decompressed data lives in the
+                # OS page cache (which can evict it) rather than in our process's memory.
+                with tempfile.TemporaryDirectory() as tmp_dir:
+                    csv_path = zip_ref.extract(csv_name, path=tmp_dir)
+                    with pa.memory_map(csv_path) as csv_file:
+                        table = pa_csv.read_csv(csv_file, convert_options=convert_options)
+
+        # Arrow keeps integer columns with missing values as integers, whereas pandas' default reader promotes them to floats.
+        # We promote them as well so that mean/median imputation downstream isn't truncated to an integer.
+        for i, field in enumerate(table.schema):
+            if pa.types.is_integer(field.type) and table.column(i).null_count > 0:
+                table = table.set_column(i, field.name, table.column(i).cast(pa.float64()))
+
+        # Arrow-backed columns store strings in contiguous buffers rather than one boxed Python object per cell.
+        # split_blocks/self_destruct let the table's buffers be released column by column while converting.
+        df = table.to_pandas(types_mapper=pd.ArrowDtype, split_blocks=True, self_destruct=True)
+        del table
 
-        # Return the DataFrame
         return df
 
 
+def _find_csv(zip_ref: zipfile.ZipFile) -> str:
+    """Returns the name of the (single) CSV file inside an opened .zip archive."""
+    # Find the CSV file (assuming there's at least one CSV file in the zip)
+    csv_files = [f for f in zip_ref.namelist() if f.endswith(".csv")]
+
+    if len(csv_files) == 0:
+        raise FileNotFoundError("No CSV file found in the ZIP file.")
+    if len(csv_files) > 1:
+        raise ValueError("Multiple CSV files found. Please specify which one to use.")
+    return csv_files[0]
+
+
 # To improve extensibility, we create a factory class that returns the appropriate DataIngestor based on the file extension.
 # My application of the Factory Design Pattern: allows us to easily add new data ingestion methods in the future without modifying existing code.
 class DataIngestorFactory:
     @staticmethod
-    def get_data_ingestor(file_extension: str) -> DataIngestor:
-        """Returns the appropriate DataIngestor based on file extension."""
+    def get_data_ingestor(file_extension: str, **ingestor_kwargs) -> DataIngestor:
+        """Returns the appropriate DataIngestor based on file extension (configured with any extra keyword arguments)."""
         if file_extension == ".zip":
-            return ZipDataIngestor()
+            return ZipDataIngestor(**ingestor_kwargs)
         else:
             raise ValueError(f"No ingestor available for file extension: {file_extension}")
 
@@ -1,17 +1,22 @@
 import pandas as pd
-from src.ingest_data import DataIngestorFactory
+from src.ingest_data import DataIngestorFactory, to_arrow_backed
 from zenml import step
 
 
 @step
-def data_ingestion_step(file_path: str) -> pd.DataFrame:
-    """Ingest data from a ZIP file using the appropriate DataIngestor."""
+def data_ingestion_step(file_path: str, use_cache: bool = True, compact_dtypes: bool = True) -> pd.DataFrame:
+    """
+    Ingest data from a ZIP file using the appropriate DataIngestor (reusing its Parquet cache unless use_cache is False).
+    With compact_dtypes, numerical columns are downcast to the narrowest safe width, shrinking the data for every later step,
+    and low-cardinality text columns are dictionary-encoded (still Arrow-backed, unlike pandas' 'category' dtype).
+    """
     # We're dealing with ZIP files, so we can hardcode the file extension.
     file_extension = ".zip"
 
     # Get the ZIP file DataIngestor
-    data_ingestor = DataIngestorFactory.get_data_ingestor(file_extension)
+    data_ingestor = DataIngestorFactory.get_data_ingestor(file_extension, use_cache=use_cache, compact_dtypes=compact_dtypes)
 
-    # Ingest the data and return it
+    # Ingest the data and return it with Arrow-backed columns (true nulls, contiguous string buffers).
+    # The ZIP ingestor already reads Arrow-backed columns, so this only converts whatever it didn't.
     df = data_ingestor.ingest(file_path)
-    return df
+    return to_arrow_backed(df)
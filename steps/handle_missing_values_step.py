@@ -1,22 +1,184 @@
+import functools
+from typing import Optional, Union
+import numpy as np
 import pandas as pd
+from src._impute_numba import mean_impute, median_impute
 from src.handle_missing_values import (
     DropMissingValuesStrategy,
     FillMissingValuesStrategy,
+    LazyBackend,
     MissingValueHandler,
+    _fill_pandas,
+    _is_polars_lazy,
+    _valid_rows,
 )
 from zenml import step
 
 
-@step
-def handle_missing_values_step(df: pd.DataFrame, strategy: str = "mean") -> pd.DataFrame:
-    """Handles missing values using the MissingValueHandler with the specified strategy."""
+@functools.lru_cache(maxsize=8)
+def _schema_plan(columns: tuple, dtypes: tuple):
+    """
+    Works out, once per schema, which columns are numerical and which of those are floats or integers.
+    The dataset's columns and dtypes are the same on every run, so repeated calls skip the per-column dtype checks.
+    """
+    is_number = [pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype) for dtype in dtypes]
+    numerical_cols = pd.Index([col for col, number in zip(columns, is_number) if number])
+    float_cols = frozenset(col for col, dtype in zip(columns, dtypes) if pd.api.types.is_float_dtype(dtype))
+    int_cols = frozenset(
+        col for col, dtype, number in zip(columns, dtypes, is_number) if number and pd.api.types.is_integer_dtype(dtype)
+    )
+    return numerical_cols, float_cols, int_cols
+
+
+def _get_schema_plan(df: pd.DataFrame):
+    """Returns the (cached) schema plan of a DataFrame: its numerical, float, and integer columns."""
+    return _schema_plan(tuple(df.columns), tuple(df.dtypes))
+
+
+def _fill_numeric(df: pd.DataFrame, method: str) -> pd.DataFrame:
+    """
+    Fills the missing values of the numerical columns with their mean/median using our Numba kernels.
+    Like FillMissingValuesStrategy, non-numerical columns are left untouched.
+    """
+    numerical_df = df[_get_schema_plan(df)[0]]
+    missing_cols = numerical_df.columns[numerical_df.count().to_numpy() < len(df)]
+
+    # A fresh column-major float64 block (NaN for missing values) that the kernel fills in place.
+    # np.array always copies: for a consolidated float block, to_numpy() returns a read-only view of the frame's data.
+    arr = np.array(df[missing_cols].to_numpy(dtype=np.float64, na_value=np.nan), order="F")
+    if method == "mean":
+        mean_impute(arr)
+    else:
+        median_impute(arr)
+
+    return _with_filled_columns(df, arr, missing_cols)
+
+
+def _with_filled_columns(df: pd.DataFrame, arr: np.ndarray, cols, integral=False) -> pd.DataFrame:
+    """
+    Returns a copy of df with the given columns replaced by the filled float64 block, keeping their original float dtypes
+    (e.g. Arrow-backed floats). If integral is True (the fill values are whole numbers), integer dtypes are kept as well.
+    """
+    _, float_cols, int_cols = _get_schema_plan(df)
+    df_cleaned = df.copy(deep=False)
+    for j, col in enumerate(cols):
+        filled = pd.Series(arr[:, j], index=df.index, name=col)
+        keep_dtype = col in float_cols or (integral and col in int_cols)
+        df_cleaned[col] = filled.astype(df[col].dtype) if keep_dtype else filled
+    return df_cleaned
+
+
+def _drop_rows(df: pd.DataFrame, cols=None) -> pd.DataFrame:
+    """
+    Drops the rows with any missing values, using a single row mask accumulated column by column.
+    This works on mixed-dtype frames without building a full missing-value mask (or an object array) of the data.
+    If given, only the columns in cols are checked (e.g. the ones known to have missing values).
+    """
+    return df[_valid_rows(df, cols)]
+
+
+def _is_float_block(df: pd.DataFrame) -> bool:
+    """Returns True if every column of the DataFrame has the same NumPy float dtype."""
+    dtypes = set(df.dtypes)
+    return len(dtypes) == 1 and all(isinstance(dtype, np.dtype) and dtype.kind == "f" for dtype in dtypes)
+
+
+def _fill_mode(df: pd.DataFrame) -> pd.DataFrame:
+    """Fills the missing values of every column with its mode."""
+    return _fill_pandas(df, "mode")
+
+
+def _fill_constant(df: pd.DataFrame, fill_value=None) -> pd.DataFrame:
+    """
+    Fills the missing values with a constant. For a numerical constant, the numerical columns are filled
+    with a single masked np.copyto over their float64 block; any other columns are filled with _fill_pandas.
+    """
+    if not isinstance(fill_value, (int, float)) or isinstance(fill_value, bool):
+        return _fill_pandas(df, "constant", fill_value)
+
+    numerical_cols = _get_schema_plan(df)[0]
+    arr = df[numerical_cols].to_numpy(dtype=np.float64, na_value=np.nan, copy=True)  # Never a read-only view of df.
+    np.copyto(arr, np.float64(fill_value), where=np.isnan(arr))
+    df_cleaned = _with_filled_columns(df, arr, numerical_cols, integral=float(fill_value).is_integer())
+
+    other_cols = df.columns.difference(numerical_cols, sort=False)
+    if len(other_cols) > 0:
+        filled = _fill_pandas(df[other_cols], "constant", fill_value)
+        for col in other_cols:
+            df_cleaned[col] = filled[col]
+    return df_cleaned
+
+
+def _make_handler(strategy: str, fill_value, backend: LazyBackend) -> MissingValueHandler:
+    """
+    Builds the MissingValueHandler for a strategy. With pandas, the step calls the strategy's function directly (see _STRATEGIES),
+    so the handler is only built for LazyFrames, the other backends, and float blocks.
+    """
     # We drop rows/columns with missing values or fill them based on the strategy provided.
     if strategy == "drop":
-        mv_handler = MissingValueHandler(DropMissingValuesStrategy(axis=0)) # Default to dropping rows with missing values.
-    elif strategy in ["mean", "median", "mode", "constant"]:
-        mv_handler = MissingValueHandler(FillMissingValuesStrategy(method=strategy))
-    else:
+        return MissingValueHandler(DropMissingValuesStrategy(axis=0, backend=backend)) # Default to dropping rows with missing values.
+    return MissingValueHandler(FillMissingValuesStrategy(method=strategy, fill_value=fill_value, backend=backend))
+
+
+# The pandas implementation of each strategy, looked up directly by name.
+_STRATEGIES = {
+    "mean": functools.partial(_fill_numeric, method="mean"),
+    "median": functools.partial(_fill_numeric, method="median"),
+    "mode": _fill_mode,
+    "constant": _fill_constant,
+    "drop": _drop_rows,
+}
+
+
+@step
+def handle_missing_values_step(
+    df: pd.DataFrame, strategy: str = "mean", backend: str = "pandas", fill_value: Optional[Union[float, str]] = None
+) -> pd.DataFrame:
+    """
+    Handles missing values using the MissingValueHandler with the specified strategy and backend ('pandas', 'polars', or 'duckdb').
+    For the 'constant' strategy, missing values are replaced with fill_value (a number, or a string for text columns).
+    """
+    if strategy not in _STRATEGIES:
         raise ValueError(f"The provided missing value handling strategy is unsupported/unknown: {strategy}")
+    if strategy == "constant" and fill_value is None:
+        raise ValueError("A fill_value must be provided for the 'constant' missing value handling strategy.")
 
-    df_cleaned = mv_handler.handle_missing_values(df)
-    return df_cleaned
+    # With the Polars backend, the work happens in Polars and the result is converted back to pandas for the step's output.
+    lazy_backend = LazyBackend(backend)
+
+    # A Polars LazyFrame (see ZipDataIngestor.scan_polars) gets the strategy added to its query plan,
+    # so reading the data and handling its missing values run as one streaming query.
+    if _is_polars_lazy(df):
+        lf_cleaned = _make_handler(strategy, fill_value, lazy_backend).handle_missing_values(df)
+        return lf_cleaned.collect(engine="streaming").to_pandas(use_pyarrow_extension_array=True)
+
+    # Only columns with missing values need handling (for Arrow-backed columns, the null counts are already known).
+    null_cols = df.columns[df.count().to_numpy() < len(df)]
+    if len(null_cols) == 0:
+        return df
+
+    # A frame made of a single NumPy float dtype (e.g. a numerical feature matrix) is handled as one array,
+    # and a DataFrame is only built once, for the step's output.
+    if lazy_backend is LazyBackend.PANDAS and _is_float_block(df):
+        mv_handler = _make_handler(strategy, fill_value, lazy_backend)
+        arr, columns, index = mv_handler.handle_missing_values_array(df.to_numpy(copy=True), df.columns, df.index)
+        return pd.DataFrame(arr, index=index, columns=columns, copy=False)
+
+    # With pandas, the strategy's function is looked up and called directly (see the NumPy fast paths above).
+    if strategy == "drop":
+        if lazy_backend is LazyBackend.PANDAS:
+            return _drop_rows(df, null_cols)
+        return _make_handler(strategy, fill_value, lazy_backend).handle_missing_values(df)
+
+    # The fill strategies only get the columns with missing values, which are then written back into df itself.
+    # The step owns its input (ZenML loads a fresh copy of the artifact), so we don't need to build a new DataFrame.
+    null_df = df[null_cols].copy(deep=False)  # Its own frame (no data is copied), so it can be filled in place.
+    if lazy_backend is LazyBackend.PANDAS:
+        handle = _STRATEGIES[strategy]
+        filled = handle(null_df, fill_value) if strategy == "constant" else handle(null_df)
+    else:
+        filled = _make_handler(strategy, fill_value, lazy_backend).handle_missing_values(null_df, inplace=True)
+
+    for col in null_cols:
+        df[col] = filled[col]
+    return df
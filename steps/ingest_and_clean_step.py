@@ -0,0 +1,23 @@
+from typing import Optional, Union
+import pandas as pd
+from steps.data_ingestion_step import data_ingestion_step
+from steps.handle_missing_values_step import handle_missing_values_step
+from zenml import step
+
+
+@step
+def ingest_and_clean_step(
+    file_path: str,
+    strategy: str = "mean",
+    backend: str = "pandas",
+    fill_value: Optional[Union[float, str]] = None,
+    use_cache: bool = True,
+    compact_dtypes: bool = True,
+) -> pd.DataFrame:
+    """
+    Ingests data from a ZIP file and handles its missing values in a single step.
+    The ingested DataFrame stays in memory instead of being materialized and loaded again between two separate steps.
+    """
+    # Call the two steps' underlying functions directly (outside of the pipeline's orchestration).
+    df = data_ingestion_step.entrypoint(file_path, use_cache=use_cache, compact_dtypes=compact_dtypes)
+    return handle_missing_values_step.entrypoint(df, strategy=strategy, backend=backend, fill_value=fill_value)
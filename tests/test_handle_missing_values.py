@@ -0,0 +1,37 @@
+from unittest import mock
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pytest
+from src import handle_missing_values
+from src.handle_missing_values import DropMissingValuesStrategy, FillMissingValuesStrategy
+
+
+@pytest.mark.parametrize("axis, threshold", [(0, None), (0, 5), (1, None), (1, 150)])
+def test_drop_handle_array_matches_dropna(axis, threshold):
+    rng = np.random.default_rng(0)
+    arr = rng.normal(size=(200, 7))
+    arr[rng.random(arr.shape) < 0.1] = np.nan
+    df = pd.DataFrame(arr)
+
+    values, columns, index = DropMissingValuesStrategy(axis=axis, threshold=threshold).handle_array(arr, df.columns, df.index)
+
+    expected = df.dropna(axis=axis, **({} if threshold is None else {"thresh": threshold}))
+    np.testing.assert_array_equal(values, expected.to_numpy())
+    assert list(columns) == list(expected.columns)
+    assert list(index) == list(expected.index)
+
+
+def test_inplace_arrow_fill_only_fills_the_columns_with_nulls(monkeypatch):
+    df = pd.DataFrame({
+        "a": pd.Series([1.0, None, 3.0], dtype=pd.ArrowDtype(pa.float64())),
+        "b": pd.Series([1.0, 2.0, 3.0], dtype=pd.ArrowDtype(pa.float64())),
+    })
+    arrow_fill = mock.Mock(wraps=handle_missing_values._arrow_fill)
+    monkeypatch.setattr(handle_missing_values, "_arrow_fill", arrow_fill)
+
+    df_cleaned = FillMissingValuesStrategy(method="mean").handle(df, inplace=True)
+
+    assert df_cleaned is df
+    assert df["a"].tolist() == [1.0, 2.0, 3.0]
+    assert list(arrow_fill.call_args.args[0].columns) == ["a"]
@@ -0,0 +1,90 @@
+from unittest import mock
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pytest
+from src import handle_missing_values
+from src.ingest_data import ARROW_DICTIONARY_DTYPE
+from steps import handle_missing_values_step as handle_missing_values_step_module
+from steps.handle_missing_values_step import handle_missing_values_step
+
+
+def _mixed_frame() -> pd.DataFrame:
+    """A NumPy-backed frame whose float columns share one consolidated block, alongside a text column."""
+    return pd.DataFrame({"a": [1.0, np.nan, 3.0], "b": [np.nan, 2.0, 2.0], "s": ["x", None, "y"]})
+
+
+@pytest.mark.parametrize("strategy", ["mean", "median"])
+def test_numeric_fill_on_numpy_backed_mixed_frame(strategy):
+    df = _mixed_frame()
+    df_cleaned = handle_missing_values_step.entrypoint(df, strategy=strategy)
+
+    assert df_cleaned["a"].tolist() == [1.0, 2.0, 3.0]
+    assert df_cleaned["b"].tolist() == [2.0, 2.0, 2.0]
+    assert df_cleaned["s"].isna().sum() == 1  # Text columns are left untouched by mean/median.
+
+
+def test_constant_fill_on_numpy_backed_mixed_frame():
+    df_cleaned = handle_missing_values_step.entrypoint(_mixed_frame(), strategy="constant", fill_value=0)
+
+    assert df_cleaned["a"].tolist() == [1.0, 0.0, 3.0]
+    assert df_cleaned["b"].tolist() == [0.0, 2.0, 2.0]
+    assert df_cleaned["s"].tolist() == ["x", 0, "y"]
+
+
+def test_constant_fill_adds_the_fill_value_to_categoricals():
+    df = pd.DataFrame({"a": [1.0, np.nan], "c": pd.Series(["x", None], dtype="category")})
+    df_cleaned = handle_missing_values_step.entrypoint(df, strategy="constant", fill_value=0)
+
+    assert df_cleaned["c"].dtype == "category"
+    assert df_cleaned["c"].tolist() == ["x", 0]
+
+
+def test_constant_fill_requires_a_fill_value():
+    with pytest.raises(ValueError):
+        handle_missing_values_step.entrypoint(_mixed_frame(), strategy="constant")
+
+
+def test_constant_fill_on_arrow_dictionary_columns():
+    df = pd.DataFrame({"c": pd.Series(["x", None, "x"], dtype="string[pyarrow]").astype(ARROW_DICTIONARY_DTYPE)})
+    df_cleaned = handle_missing_values_step.entrypoint(df, strategy="constant", fill_value=0)
+
+    assert df_cleaned["c"].dtype == ARROW_DICTIONARY_DTYPE
+    assert df_cleaned["c"].tolist() == ["x", "0", "x"]
+
+
+@pytest.mark.parametrize("strategy", ["mode", "constant"])
+def test_fills_arrow_columns_in_a_thread_pool(monkeypatch, strategy):
+    df = pd.DataFrame({
+        "a": pd.Series([1.5, None, 1.5], dtype=pd.ArrowDtype(pa.float64())),
+        "s": pd.Series(["x", None, "x"], dtype=pd.ArrowDtype(pa.string())),
+    })
+    monkeypatch.setattr(handle_missing_values, "_PARALLEL_MIN_CELLS", 0)
+    monkeypatch.setattr(handle_missing_values.os, "cpu_count", lambda: 2)
+    executor = mock.Mock(wraps=handle_missing_values.ThreadPoolExecutor)
+    monkeypatch.setattr(handle_missing_values, "ThreadPoolExecutor", executor)
+
+    df_cleaned = handle_missing_values_step.entrypoint(df, strategy=strategy, fill_value=0)
+
+    assert executor.called
+    assert df_cleaned.isna().sum().sum() == 0
+
+
+@pytest.mark.parametrize("strategy", ["mean", "median", "mode", "constant", "drop"])
+def test_pandas_backend_skips_the_strategy_objects(monkeypatch, strategy):
+    constructors = {}
+    for name in ("MissingValueHandler", "FillMissingValuesStrategy", "DropMissingValuesStrategy"):
+        constructors[name] = mock.Mock()
+        monkeypatch.setattr(handle_missing_values_step_module, name, constructors[name])
+        monkeypatch.setattr(handle_missing_values, name, constructors[name])
+
+    handle_missing_values_step.entrypoint(_mixed_frame(), strategy=strategy, fill_value=0)
+
+    for constructor in constructors.values():
+        constructor.assert_not_called()
+
+
+def test_constant_fill_with_a_string():
+    df_cleaned = handle_missing_values_step.entrypoint(_mixed_frame()[["s"]], strategy="constant", fill_value="missing")
+
+    assert df_cleaned["s"].tolist() == ["x", "missing", "y"]
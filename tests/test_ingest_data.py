@@ -0,0 +1,45 @@
+import zipfile
+from unittest import mock
+import pytest
+import pandas as pd
+from src.ingest_data import IngestedFrame, ZipDataIngestor, unwrap_frame
+
+pl = pytest.importorskip("polars")
+
+
+@pytest.fixture
+def zip_path(tmp_path):
+    path = tmp_path / "archive.zip"
+    with zipfile.ZipFile(path, "w") as zip_ref:
+        zip_ref.writestr("data.csv", "id,count,name\n1,10,a\n2,NA,\n3,30,c\n")
+    return str(path)
+
+
+@pytest.mark.parametrize("use_cache", [True, False])
+def test_scan_polars_scans_the_csv_without_a_cache(tmp_path, zip_path, use_cache):
+    ingestor = ZipDataIngestor(cache_dir=str(tmp_path / "cache"), use_cache=use_cache)
+    with mock.patch.object(ZipDataIngestor, "ingest") as ingest:
+        df = ingestor.scan_polars(zip_path).collect()
+
+    ingest.assert_not_called()  # The CSV isn't parsed eagerly first.
+    assert df.schema["id"].is_integer()
+    assert df.schema["count"] == pl.Float64  # Integer columns with missing values are promoted, like ingest().
+    assert df.null_count().row(0) == (0, 1, 1)
+
+
+def test_scan_polars_leaves_no_extracted_csv(tmp_path, zip_path):
+    cache_dir = tmp_path / "cache"
+    ZipDataIngestor(cache_dir=str(cache_dir)).scan_polars(zip_path).collect()
+
+    assert not cache_dir.exists() or not any(cache_dir.iterdir())
+
+
+def test_unwrap_frame():
+    df = pd.DataFrame({"x": [1.0, 2.0], "s": ["a", "b"]})
+    frame = IngestedFrame.from_dataframe(df)
+
+    assert unwrap_frame(df) == (df, None)
+    assert unwrap_frame(frame) == (df, ["x"])
+    assert unwrap_frame(frame.select(["s"]))[1] == []
+    with pytest.raises(TypeError):
+        unwrap_frame(df.to_numpy())
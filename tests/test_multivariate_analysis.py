@@ -0,0 +1,13 @@
+import numpy as np
+import pandas as pd
+from analysis.implementations.multivariate_analysis import SimpleMultivariateAnalysis
+
+
+def test_correlation_matrix_matches_pandas_on_long_high_offset_data():
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(rng.normal(1e6, 1.0, size=(200_000, 5)), columns=list("abcde"))
+    df["f"] = df["a"] * 2 + rng.normal(0.0, 1.0, size=len(df))  # A correlated column as well.
+
+    corr = SimpleMultivariateAnalysis()._correlation_matrix(df)
+
+    np.testing.assert_allclose(corr.to_numpy(), df.corr().to_numpy(), atol=1e-2)
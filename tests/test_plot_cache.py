@@ -0,0 +1,65 @@
+import matplotlib
+
+matplotlib.use("Agg")
+
+import pandas as pd
+import pytest
+from analysis.implementations import _plot_cache
+from analysis.implementations._plot_cache import cached_plot
+
+PLOTTER_SOURCE = '''
+class Plotter:
+    calls = 0
+
+    @cached_plot("test_plot")
+    def plot(self, df):
+        type(self).calls += 1
+        plt.figure()
+        plt.title({title!r})
+        plt.show()
+'''
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(_plot_cache, "CACHE_DIR", str(tmp_path))
+    monkeypatch.delenv("NO_PLOT_CACHE", raising=False)
+    return tmp_path
+
+
+def _make_plotter(title: str):
+    """Compiles an analysis class whose plotting method draws the given title (a stand-in for editing the method)."""
+    namespace = {"cached_plot": cached_plot, "plt": _plot_cache.plt}
+    exec(PLOTTER_SOURCE.format(title=title), namespace)
+    return namespace["Plotter"]
+
+
+def test_cache_is_reused_for_the_same_code_and_data(cache_dir):
+    df = pd.DataFrame({"x": [1, 2]})
+    _make_plotter("a")().plot(df)
+    plotter_cls = _make_plotter("a")
+    plotter_cls().plot(df)
+
+    assert plotter_cls.calls == 0
+    assert len(list(cache_dir.iterdir())) == 1
+
+
+def test_editing_the_plotting_method_changes_the_key(cache_dir):
+    df = pd.DataFrame({"x": [1, 2]})
+    _make_plotter("a")().plot(df)
+    plotter_cls = _make_plotter("b")
+    plotter_cls().plot(df)
+
+    assert plotter_cls.calls == 1
+    assert len(list(cache_dir.iterdir())) == 2
+
+
+def test_cache_can_be_bypassed(cache_dir, monkeypatch):
+    df = pd.DataFrame({"x": [1, 2]})
+    plotter_cls = _make_plotter("a")
+    plotter_cls().plot(df, use_cache=False)
+    monkeypatch.setenv("NO_PLOT_CACHE", "1")
+    plotter_cls().plot(df)
+
+    assert plotter_cls.calls == 2
+    assert not any(cache_dir.iterdir())